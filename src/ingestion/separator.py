@@ -224,12 +224,12 @@ class MikupSeparator:
     def _write_silent_wav(path, duration_seconds=3.0, sample_rate=22050, channels=2):
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         frame_count = max(1, int(duration_seconds * sample_rate))
-        silence_frame = b"\x00\x00" * channels
         with wave.open(path, "wb") as wav_file:
             wav_file.setnchannels(channels)
             wav_file.setsampwidth(2)
             wav_file.setframerate(sample_rate)
-            wav_file.writeframes(silence_frame * frame_count)
+            # bytes(n) is a single zeroed allocation; 16-bit PCM silence is all zero bytes.
+            wav_file.writeframes(bytes(frame_count * channels * 2))
         return str(Path(path).resolve())
 
     def _canonicalize_stem_file(self, stem_path, source_base, stem_name):
@@ -18,6 +18,12 @@ from typing import Any, TypeVar
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field, ValidationError
 
+# Resolved once: a missing orjson should not cost an import search per state read/write.
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
@@ -144,6 +150,7 @@ REDO_STAGE_ALIASES = {
 }
 CANONICAL_STEM_KEYS = ("DX", "Music", "Effects")
 OPTIONAL_STEM_KEYS = ("DX_Residual",)
+_MOCK_STEM_KEYS = CANONICAL_STEM_KEYS + OPTIONAL_STEM_KEYS
 
 # Keep a str alias for code that still references `project_root` by name
 project_root = str(PROJECT_ROOT)
@@ -188,9 +195,11 @@ def ensure_output_dir(output_path):
     return str(parent)
 
 
+_EMPTY_TRANSCRIPTION_BYTES = json.dumps({"segments": []}).encode("utf-8")
+
+
 def write_empty_transcription(path):
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump({"segments": []}, f)
+    Path(path).write_bytes(_EMPTY_TRANSCRIPTION_BYTES)
 
 
 def _read_json_file(path, default=None, model: type[_M] | None = None):
@@ -205,8 +214,17 @@ def _read_json_file(path, default=None, model: type[_M] | None = None):
         return default
     with _state_lock:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            if orjson is None:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            else:
+                raw = Path(path).read_bytes()
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    # stdlib writers (and older state files) emit NaN/Infinity,
+                    # which orjson rejects.
+                    data = json.loads(raw)
             if model is not None and isinstance(data, dict):
                 try:
                     return model.model_validate(data)
@@ -224,6 +242,16 @@ def _read_json_file(path, default=None, model: type[_M] | None = None):
             return default
 
 
+def _contains_non_finite(value):
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_contains_non_finite(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_contains_non_finite(item) for item in value)
+    return False
+
+
 def _write_json_file(path, payload):
     with _state_lock:
         ensure_output_dir(path)
@@ -231,10 +259,26 @@ def _write_json_file(path, payload):
         target = Path(path)
         tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
         try:
-            with open(tmp_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
-                f.flush()
-                os.fsync(f.fileno())
+            # orjson writes NaN/Infinity as null; keep stdlib json for those payloads.
+            if orjson is None or _contains_non_finite(data):
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+            else:
+                # One buffer and one write instead of json.dump's per-token writes.
+                # Options match save_results; json.dump also accepts non-str keys.
+                with open(tmp_path, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            data,
+                            option=orjson.OPT_INDENT_2
+                            | orjson.OPT_SERIALIZE_NUMPY
+                            | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+                    f.flush()
+                    os.fsync(f.fileno())
             os.replace(tmp_path, target)
         finally:
             if tmp_path.exists():
@@ -447,52 +491,96 @@ def _persist_state(state_path, state, args, output_dir, artifacts, stems):
         _write_json_file(state_path, state)
 
 
-def _has_transcription_payload(path):
-    payload = _read_json_file(path)
+# (check, path) -> ((mtime_ns, size, inode), verdict) for single-file artifact checks.
+_artifact_check_cache: dict[tuple, tuple] = {}
+
+
+def _cached_artifact_check(path, check) -> bool:
+    """Run check() on a JSON file's payload, reusing the verdict while the file is unchanged."""
+    try:
+        st = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return bool(check(None))
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = (check, str(path))
+    with _state_lock:
+        cached = _artifact_check_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    verdict = bool(check(_read_json_file(path)))
+    with _state_lock:
+        _artifact_check_cache[key] = (stamp, verdict)
+    return verdict
+
+
+def _is_transcription_payload(payload):
     return isinstance(payload, dict) and isinstance(payload.get("segments"), list)
 
 
-def _has_semantics_payload(path):
-    payload = _read_json_file(path)
+def _is_semantics_payload(payload):
     return isinstance(payload, list)
 
 
-def validate_stage_artifacts(stage_name: str, output_dir: str) -> bool:
-    """Return True if the given stage's output artifacts exist and are structurally valid."""
-    out = Path(output_dir)
-    try:
-        if stage_name == "separation":
-            stems_path = str(out / "data" / "stems.json")
-            stems = _read_json_file(stems_path)
-            if not isinstance(stems, dict):
-                return False
-            normalize_and_validate_stems(stems)
-            return True
-
-        if stage_name == "transcription":
-            return _has_transcription_payload(str(out / "data" / "transcription.json"))
-
-        if stage_name == "dsp":
-            dsp_metrics_path = str(out / "data" / "dsp_metrics.json")
-            metrics = _read_json_file(dsp_metrics_path, default={})
-            if isinstance(metrics, dict) and bool(metrics):
-                return True
-            stage_state = _read_json_file(str(out / "data" / "stage_state.json"), default={})
-            stages = stage_state.get("stages") if isinstance(stage_state, dict) else {}
-            dsp_state = stages.get("dsp") if isinstance(stages, dict) else {}
-            return isinstance(dsp_state, dict) and bool(
-                dsp_state.get("completed") or dsp_state.get("is_complete")
-            )
+def _is_nonempty_dict(payload):
+    return isinstance(payload, dict) and bool(payload)
+
+
+def _has_transcription_payload(path):
+    return _cached_artifact_check(path, _is_transcription_payload)
 
-        if stage_name == "semantics":
-            return _has_semantics_payload(str(out / "data" / "semantics.json"))
 
-        if stage_name == "director":
-            payload_path = str(out / "mikup_payload.json")
-            payload = _read_json_file(payload_path)
-            return isinstance(payload, dict) and bool(payload)
+def _has_semantics_payload(path):
+    return _cached_artifact_check(path, _is_semantics_payload)
 
+
+def _separation_artifacts_valid(out: Path) -> bool:
+    stems = _read_json_file(str(out / "data" / "stems.json"))
+    if not isinstance(stems, dict):
+        return False
+    normalize_and_validate_stems(stems)
+    return True
+
+
+def _transcription_artifacts_valid(out: Path) -> bool:
+    return _has_transcription_payload(str(out / "data" / "transcription.json"))
+
+
+def _dsp_artifacts_valid(out: Path) -> bool:
+    if _cached_artifact_check(str(out / "data" / "dsp_metrics.json"), _is_nonempty_dict):
+        return True
+    stage_state = _read_json_file(str(out / "data" / "stage_state.json"), default={})
+    stages = stage_state.get("stages") if isinstance(stage_state, dict) else {}
+    dsp_state = stages.get("dsp") if isinstance(stages, dict) else {}
+    return isinstance(dsp_state, dict) and bool(
+        dsp_state.get("completed") or dsp_state.get("is_complete")
+    )
+
+
+def _semantics_artifacts_valid(out: Path) -> bool:
+    return _has_semantics_payload(str(out / "data" / "semantics.json"))
+
+
+def _director_artifacts_valid(out: Path) -> bool:
+    return _cached_artifact_check(str(out / "mikup_payload.json"), _is_nonempty_dict)
+
+
+# One validator per stage, resolved with a single lookup per call.
+_STAGE_ARTIFACT_VALIDATORS = {
+    "separation": _separation_artifacts_valid,
+    "transcription": _transcription_artifacts_valid,
+    "dsp": _dsp_artifacts_valid,
+    "semantics": _semantics_artifacts_valid,
+    "director": _director_artifacts_valid,
+}
+
+
+def validate_stage_artifacts(stage_name: str, output_dir: str) -> bool:
+    """Return True if the given stage's output artifacts exist and are structurally valid."""
+    validator = _STAGE_ARTIFACT_VALIDATORS.get(stage_name)
+    if validator is None:
         return False
+    try:
+        return validator(Path(output_dir))
     except Exception as exc:
         logger.warning("validate_stage_artifacts(%s): unexpected error: %s", stage_name, exc)
         return False
@@ -510,15 +598,17 @@ def _write_silent_wav(path, duration_seconds=3.0, sample_rate=22050, channels=2)
 def _mock_stems(output_dir, source_hint="mock"):
     base_name = Path(source_hint).stem or "mock"
     out = Path(output_dir)
-    stems = {
-        "DX": str(out / f"{base_name}_DX.wav"),
-        "Music": str(out / f"{base_name}_Music.wav"),
-        "Effects": str(out / f"{base_name}_Effects.wav"),
-        "DX_Residual": str(out / f"{base_name}_DX_Residual.wav"),
-    }
+    stems = {key: str(out / f"{base_name}_{key}.wav") for key in _MOCK_STEM_KEYS}
+    # The stems are identical, so encode one WAV and copy it for the rest.
+    template_path = None
     for stem_path in stems.values():
-        if not is_existing_file(stem_path):
+        if is_existing_file(stem_path):
+            continue
+        if template_path is None:
             _write_silent_wav(stem_path)
+            template_path = stem_path
+        else:
+            shutil.copyfile(template_path, stem_path)
     return stems
 
 
@@ -1445,6 +1535,10 @@ def main():
         elif is_existing_file(stems.get("DX")):
             transcriber = MikupTranscriber()
             try:
+                hf_token = os.getenv("HF_TOKEN")
+                if not args.fast:
+                    # Load pyannote in the background while whisper decodes.
+                    transcriber.prefetch_diarization_pipeline(hf_token)
                 transcription_result = transcriber.transcribe(
                     stems["DX"],
                     fast_mode=args.fast,
@@ -1455,7 +1549,7 @@ def main():
                     transcription_result = transcriber.diarize(
                         stems["DX"],
                         transcription_result,
-                        os.getenv("HF_TOKEN"),
+                        hf_token,
                     )
 
                 transcriber.save_results(transcription_result, transcription_path)
@@ -1468,6 +1562,8 @@ def main():
                     logger.error("Failed to write fallback transcription file: %s", write_exc)
                     sys.exit(1)
             finally:
+                # Waits out a still-running pyannote prefetch before VRAM is flushed.
+                transcriber.close()
                 del transcriber
                 flush_vram()
                 gc.collect()
@@ -1,14 +1,18 @@
+import os
 from pathlib import Path
 
 import torch
 import librosa
 import logging
+import numpy as np
+import soundfile as sf
 from transformers import AutoProcessor, ClapModel
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 _MODELS_DIR = Path(__file__).resolve().parent.parent.parent / "models"
+_CLAP_SAMPLE_RATE = 48000
 
 class MikupSemanticTagger:
     """
@@ -50,6 +54,54 @@ class MikupSemanticTagger:
             "Ocean waves"
         ]
 
+        if self.device == "cuda" and os.environ.get("MIKUP_TORCH_COMPILE", "").strip() == "1":
+            self._compile_model()
+
+    def _compile_model(self):
+        """
+        Compile the CLAP forward (opt-in via MIKUP_TORCH_COMPILE=1) and run one
+        warm-up pass so the compile cost is paid here, not on the first tag call.
+        Falls back to the eager model if compilation fails on this CUDA stack.
+        """
+        eager_model = self.model
+        try:
+            logger.info("Compiling CLAP model with torch.compile (reduce-overhead)...")
+            self.model = torch.compile(eager_model, mode="reduce-overhead", dynamic=False)
+            self._predict(np.zeros(_CLAP_SAMPLE_RATE * 5, dtype=np.float32), self.default_labels)
+        except Exception as exc:
+            logger.warning(
+                "torch.compile failed for CLAP (%s: %s); using eager model.",
+                type(exc).__name__,
+                exc,
+            )
+            self.model = eager_model
+
+    def _predict(self, y, candidate_labels):
+        """Run CLAP on a 48 kHz window and return per-label probabilities."""
+        raw_inputs = self.processor(
+            text=candidate_labels,
+            audio=y,
+            return_tensors="pt",
+            padding=True,
+            sampling_rate=_CLAP_SAMPLE_RATE
+        )
+        inputs = {}
+        for key, value in raw_inputs.items():
+            if torch.is_tensor(value):
+                if value.is_floating_point():
+                    inputs[key] = value.to(device=self.device, dtype=self.model_dtype)
+                else:
+                    inputs[key] = value.to(device=self.device)
+            else:
+                inputs[key] = value
+
+        with torch.no_grad():
+            outputs = self.model(**inputs)
+
+        # Get logits and compute probabilities
+        logits_per_audio = outputs.logits_per_audio
+        return logits_per_audio.softmax(dim=-1).cpu().numpy()[0]
+
     def tag_audio(self, audio_path, candidate_labels=None):
         """
         Performs zero-shot classification on an audio file.
@@ -61,9 +113,18 @@ class MikupSemanticTagger:
         logger.info("Tagging audio: %s", audio_path)
 
         try:
-            # Calculate duration first without loading the full audio
-            full_duration = librosa.get_duration(path=audio_path)
-        except OSError as exc:
+            # Read duration from the file header; no audio is decoded here
+            info = sf.info(audio_path)
+            full_duration = info.frames / info.samplerate
+        except sf.LibsndfileError:
+            # libsndfile cannot parse every container (e.g. some MP3/M4A);
+            # librosa falls back to audioread for those.
+            try:
+                full_duration = librosa.get_duration(path=audio_path)
+            except (OSError, RuntimeError, ValueError) as exc:
+                logger.warning("Cannot read audio file %s: %s", audio_path, exc)
+                return []
+        except (OSError, RuntimeError) as exc:
             logger.warning("Cannot read audio file %s: %s", audio_path, exc)
             return []
 
@@ -77,44 +138,19 @@ class MikupSemanticTagger:
 
         try:
             # Load and resample ONLY the 5-second window to 48kHz (CLAP standard)
-            y, _ = librosa.load(audio_path, sr=48000, offset=start_sec, duration=duration_to_load)
+            y, _ = librosa.load(audio_path, sr=_CLAP_SAMPLE_RATE, offset=start_sec, duration=duration_to_load)
         except OSError as exc:
             logger.warning("Cannot load audio file %s: %s", audio_path, exc)
             return []
-        
-        # Prepare inputs
-        raw_inputs = self.processor(
-            text=candidate_labels,
-            audio=y,
-            return_tensors="pt",
-            padding=True,
-            sampling_rate=48000
-        )
-        inputs = {}
-        for key, value in raw_inputs.items():
-            if torch.is_tensor(value):
-                if value.is_floating_point():
-                    inputs[key] = value.to(device=self.device, dtype=self.model_dtype)
-                else:
-                    inputs[key] = value.to(device=self.device)
-            else:
-                inputs[key] = value
 
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            
-        # Get logits and compute probabilities
-        logits_per_audio = outputs.logits_per_audio
-        probs = logits_per_audio.softmax(dim=-1).cpu().numpy()[0]
-        
-        # Sort labels by probability
-        results = sorted(
-            [{"label": label, "score": float(prob)} for label, prob in zip(candidate_labels, probs)],
-            key=lambda x: x["score"],
-            reverse=True
-        )
-        
-        return results[:3] # Return top 3 tags
+        probs = self._predict(y, candidate_labels)
+
+        # Partial sort: only the top 3 indices are ordered, the rest of the label set is never sorted
+        top_k = min(3, probs.shape[0])
+        top_idx = np.argpartition(probs, -top_k)[-top_k:]
+        top_idx = top_idx[np.argsort(-probs[top_idx], kind="stable")]
+
+        return [{"label": candidate_labels[i], "score": float(probs[i])} for i in top_idx]
 
 if __name__ == "__main__":
     import sys
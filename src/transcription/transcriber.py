@@ -1,13 +1,19 @@
+import functools
 import logging
 import json
+import os
 import platform
 import inspect
 import re
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
+from typing import NamedTuple
 
 import librosa
 import numpy as np
+from numba import njit
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,9 +21,20 @@ logger = logging.getLogger(__name__)
 # Project-local model directory (populated by scripts/download_models.py)
 _MODELS_DIR = Path(__file__).resolve().parent.parent.parent / "models"
 
+# mlx-community repo suffix per MIKUP_MLX_QUANT value; q4 is ~2-4x faster than fp16 at a small WER cost.
+_MLX_QUANT_SUFFIXES = {"q4": "-q4", "q8": "-8bit", "fp16": ""}
+_MLX_DEFAULT_QUANT = "q4"
 
+_EMPTY_F32 = np.empty(0, dtype=np.float32)
+
+# Below these durations the VAD pre-pass costs more than it saves (whisper's context is 30 s).
+_VAD_MIN_SECONDS = 30.0
+_VAD_MIN_SECONDS_FULL = 120.0
+
+
+@functools.lru_cache(maxsize=1)
 def _detect_devices():
-    """Auto-detect best available compute device for each engine.
+    """Auto-detect best available compute device for each engine (probed once per process).
 
     Returns:
         ct2_device   - faster-whisper/CTranslate2 device ("cpu" or "cuda")
@@ -34,6 +51,69 @@ def _detect_devices():
     return "cpu", "int8", "cpu"
 
 
+def _mlx_quant_from_env():
+    """Read MIKUP_MLX_QUANT (q4, q8 or fp16), defaulting to q4."""
+    value = os.environ.get("MIKUP_MLX_QUANT", "").strip().lower()
+    if not value:
+        return _MLX_DEFAULT_QUANT
+    if value not in _MLX_QUANT_SUFFIXES:
+        logger.warning(
+            "Ignoring MIKUP_MLX_QUANT=%r; expected one of %s. Using %s.",
+            value,
+            ", ".join(_MLX_QUANT_SUFFIXES),
+            _MLX_DEFAULT_QUANT,
+        )
+        return _MLX_DEFAULT_QUANT
+    return value
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_mlx_kwargs_template(transcribe_fn):
+    """Return (model kwarg name, accepts verbose) for an mlx_whisper.transcribe build."""
+    try:
+        parameters = inspect.signature(transcribe_fn).parameters
+    except (TypeError, ValueError):
+        return "path_or_hf_repo", False
+    model_key = next(
+        (key for key in ("path_or_hf_repo", "model", "model_path", "repo_id") if key in parameters),
+        None,
+    )
+    return model_key, "verbose" in parameters
+
+
+@njit(cache=True)
+def _filter_and_merge_intervals(raw_intervals, sample_rate, min_speech_seconds, max_gap_seconds):
+    """
+    Convert (N, 2) sample-index speech regions to seconds, drop regions shorter
+    than min_speech_seconds and merge neighbours separated by <= max_gap_seconds.
+    """
+    merged = np.empty((raw_intervals.shape[0], 2), dtype=np.float64)
+    count = 0
+    for row in range(raw_intervals.shape[0]):
+        start = raw_intervals[row, 0] / sample_rate
+        end = raw_intervals[row, 1] / sample_rate
+        if end - start < min_speech_seconds:
+            continue
+        if count > 0 and start - merged[count - 1, 1] <= max_gap_seconds:
+            if end > merged[count - 1, 1]:
+                merged[count - 1, 1] = end
+        else:
+            merged[count, 0] = start
+            merged[count, 1] = end
+            count += 1
+    return merged[:count]
+
+
+class _DiarizationTurns(NamedTuple):
+    """Diarization turns as parallel arrays sorted by start time."""
+    starts: np.ndarray
+    ends: np.ndarray
+    # Running max of ends: monotone, so it can be binary-searched even when turns overlap.
+    reach: np.ndarray
+    speaker_ids: np.ndarray
+    labels: list
+
+
 class MikupTranscriber:
     """
     Stage 2: Transcription and Speaker Diarization.
@@ -44,23 +124,97 @@ class MikupTranscriber:
         self.model_size = model_size
         self.prefer_mlx = prefer_mlx
         self.apple_silicon = platform.system() == "Darwin" and platform.machine() == "arm64"
+        self.mlx_quant = _mlx_quant_from_env()
         self.ct2_device, self.ct2_compute, self.torch_device = _detect_devices()
+        # Loaded lazily on first use and reused by later transcribe()/diarize() calls.
+        self._whisper_model = None
+        self._whisper_model_key = None
+        self._batched_whisper_model = None
+        self._mlx_transcriber = None
+        self._mlx_accepts_ndarray = True
+        self._diarization_pipeline = None
+        self._diarization_prefetch = None
+        # (audio_path, mono_16k, sample_rate) of the last decoded file, shared by
+        # the VAD/ASR pass and diarization so the stem is only decoded once.
+        self._decoded_audio = None
         logger.info(
             "MikupTranscriber: faster-whisper on %s/%s, pyannote on %s",
             self.ct2_device, self.ct2_compute, self.torch_device,
         )
 
     @staticmethod
-    def _assign_speaker(seg_start, seg_end, diarization):
-        """Return the speaker label with the most overlap in [seg_start, seg_end]."""
-        speaker_overlap = {}
+    def _index_diarization_turns(diarization):
+        """Materialize diarization turns once so each segment lookup is a binary search."""
+        starts = []
+        ends = []
+        speaker_ids = []
+        label_ids = {}
         for turn, _, speaker in diarization.itertracks(yield_label=True):
-            overlap = min(seg_end, turn.end) - max(seg_start, turn.start)
-            if overlap > 0:
-                speaker_overlap[speaker] = speaker_overlap.get(speaker, 0) + overlap
-        if not speaker_overlap:
-            return "Dialogue"
-        return max(speaker_overlap, key=speaker_overlap.get)
+            starts.append(turn.start)
+            ends.append(turn.end)
+            speaker_ids.append(label_ids.setdefault(speaker, len(label_ids)))
+
+        starts = np.asarray(starts, dtype=np.float64)
+        order = np.argsort(starts, kind="stable")
+        starts = starts[order]
+        ends = np.asarray(ends, dtype=np.float64)[order]
+        reach = np.maximum.accumulate(ends) if ends.size else ends
+        return _DiarizationTurns(
+            starts=starts,
+            ends=ends,
+            reach=reach,
+            speaker_ids=np.asarray(speaker_ids, dtype=np.intp)[order],
+            labels=list(label_ids),
+        )
+
+    @staticmethod
+    def _assign_speaker(seg_start, seg_end, turns):
+        """Return the speaker label with the most overlap in [seg_start, seg_end]."""
+        return MikupTranscriber._assign_speakers(
+            np.array([seg_start], dtype=np.float64),
+            np.array([seg_end], dtype=np.float64),
+            turns,
+        )[0]
+
+    @staticmethod
+    def _assign_speakers(seg_starts, seg_ends, turns):
+        """Vectorized _assign_speaker: one label per (start, end) pair."""
+        if turns.starts.size == 0:
+            return ["Dialogue"] * len(seg_starts)
+        if turns.starts.size == 1:
+            # Single-speaker diarization: no windowing or per-speaker reduction needed.
+            label = turns.labels[int(turns.speaker_ids[0])]
+            overlaps = np.minimum(seg_ends, turns.ends[0]) > np.maximum(seg_starts, turns.starts[0])
+            return [label if hit else "Dialogue" for hit in overlaps.tolist()]
+
+        # Turns at or past `hi` start after a segment; turns before `lo` end before it.
+        his = np.searchsorted(turns.starts, seg_ends, side="left")
+        los = np.searchsorted(turns.reach, seg_starts, side="right")
+
+        labels = []
+        for seg_start, seg_end, lo, hi in zip(
+            seg_starts.tolist(), seg_ends.tolist(), los.tolist(), his.tolist()
+        ):
+            if hi <= lo:
+                labels.append("Dialogue")
+                continue
+
+            overlap = (
+                np.minimum(seg_end, turns.ends[lo:hi])
+                - np.maximum(seg_start, turns.starts[lo:hi])
+            )
+            positive = overlap > 0
+            if not positive.any():
+                labels.append("Dialogue")
+                continue
+
+            speaker_overlap = np.bincount(
+                turns.speaker_ids[lo:hi][positive],
+                weights=overlap[positive],
+                minlength=len(turns.labels),
+            )
+            labels.append(turns.labels[int(speaker_overlap.argmax())])
+        return labels
 
     @staticmethod
     def _apply_fallback_speakers(transcription_result):
@@ -78,8 +232,6 @@ class MikupTranscriber:
 
         existing_generic_indices = set()
         for segment in segments:
-            if not isinstance(segment, dict):
-                continue
             speaker = str(segment.get("speaker") or "").strip()
             match = re.fullmatch(r"Speaker\s+(\d+)", speaker)
             if match:
@@ -89,9 +241,6 @@ class MikupTranscriber:
         fallback_identity_to_label: dict[str, str] = {}
 
         for segment in segments:
-            if not isinstance(segment, dict):
-                continue
-
             raw_speaker = segment.get("speaker")
             speaker = str(raw_speaker or "").strip()
             normalized = speaker.upper()
@@ -125,8 +274,6 @@ class MikupTranscriber:
 
         normalized_segments = []
         for segment in segments:
-            if not isinstance(segment, dict):
-                continue
             start = MikupTranscriber._safe_float(segment.get("start"), None)
             end = MikupTranscriber._safe_float(segment.get("end"), None)
             if start is None or end is None:
@@ -138,33 +285,54 @@ class MikupTranscriber:
         if len(normalized_segments) < 2:
             return []
 
-        normalized_segments.sort(key=lambda item: item[0])
-        pacing_mikups = []
-        for previous, current in zip(normalized_segments, normalized_segments[1:]):
-            previous_end = previous[1]
-            current_start = current[0]
-            gap_seconds = current_start - previous_end
-            if gap_seconds <= min_gap_seconds:
-                continue
+        normalized_segments.sort(key=itemgetter(0))
+        bounds = np.array([(start, end) for start, end, _ in normalized_segments], dtype=np.float64)
+        gaps = bounds[1:, 0] - bounds[:-1, 1]
+        gap_indices = np.flatnonzero(gaps > min_gap_seconds)
+        if gap_indices.size == 0:
+            return []
+        durations_ms = np.rint(gaps[gap_indices] * 1000.0).astype(np.int64)
+
+        def _speaker(segment):
+            return str(segment.get("speaker") or "Dialogue").strip() or "Dialogue"
+
+        # Dicts are only built for the gaps that survive the threshold.
+        return [
+            {
+                "timestamp": normalized_segments[index][1],
+                "duration_ms": int(duration_ms),
+                "context": (
+                    f"Between [{_speaker(normalized_segments[index][2])}] "
+                    f"and [{_speaker(normalized_segments[index + 1][2])}]"
+                ),
+            }
+            for index, duration_ms in zip(gap_indices.tolist(), durations_ms.tolist())
+        ]
 
-            previous_speaker = str(previous[2].get("speaker") or "Dialogue").strip() or "Dialogue"
-            current_speaker = str(current[2].get("speaker") or "Dialogue").strip() or "Dialogue"
-            pacing_mikups.append({
-                "timestamp": previous_end,
-                "duration_ms": int(round(gap_seconds * 1000.0)),
-                "context": f"Between [{previous_speaker}] and [{current_speaker}]",
-            })
+    @staticmethod
+    def _segments_ok(transcription_result):
+        """True if the result is a dict whose "segments" is a list of dicts; checked once per entry point."""
+        if not isinstance(transcription_result, dict):
+            return False
+        segments = transcription_result.get("segments", [])
+        return isinstance(segments, list) and all(type(segment) is dict for segment in segments)
 
-        return pacing_mikups
+    @classmethod
+    def _require_segments(cls, transcription_result):
+        if not cls._segments_ok(transcription_result):
+            raise ValueError("transcription result must be a dict with a list of segment dicts")
 
     def _attach_pacing_mikups(self, transcription_result):
-        if not isinstance(transcription_result, dict):
-            return transcription_result
+        self._require_segments(transcription_result)
         transcription_result["pacing_mikups"] = self._build_pacing_mikups(transcription_result)
         return transcription_result
 
-    def _mlx_model_ref(self):
-        local_path = _MODELS_DIR / f"whisper-{self.model_size}-mlx"
+    def _mlx_model_ref(self, quant=None):
+        quant = quant or self.mlx_quant
+        suffix = _MLX_QUANT_SUFFIXES[quant]
+        # Only the local dir for this precision: the unsuffixed fp16 dir is
+        # reached through the explicit fp16 fallback, so the logged quant is right.
+        local_path = _MODELS_DIR / f"whisper-{self.model_size}-mlx{suffix}"
         if local_path.is_dir():
             return str(local_path)
 
@@ -176,7 +344,7 @@ class MikupTranscriber:
             "large": "mlx-community/whisper-large-v3-mlx",
             "large-v3": "mlx-community/whisper-large-v3-mlx",
         }
-        return known_models.get(self.model_size, "mlx-community/whisper-small-mlx")
+        return known_models.get(self.model_size, "mlx-community/whisper-small-mlx") + suffix
 
     @staticmethod
     def _safe_float(value, default=0.0):
@@ -205,26 +373,84 @@ class MikupTranscriber:
             return True
         return False
 
+    def _load_mono_16k(self, audio_path):
+        """Decode audio_path to mono 16 kHz float32, reusing the last decode of the same file."""
+        cache_key = self._decode_cache_key(audio_path)
+        if self._decoded_audio is not None and self._decoded_audio[0] == cache_key:
+            return self._decoded_audio[1], self._decoded_audio[2]
+
+        y, sr = self._decode_mono_16k(audio_path)
+        self._decoded_audio = (cache_key, y, sr)
+        return y, sr
+
     @staticmethod
-    def _merge_intervals(intervals, max_gap=0.15):
-        if not intervals:
-            return []
+    def _decode_cache_key(audio_path):
+        """Path plus mtime and size, so a file rewritten in place is decoded again."""
+        try:
+            stat = os.stat(audio_path)
+        except OSError:
+            return (str(audio_path), None, None)
+        return (str(audio_path), stat.st_mtime_ns, stat.st_size)
 
-        merged = [list(intervals[0])]
-        for start, end in intervals[1:]:
-            if start - merged[-1][1] <= max_gap:
-                merged[-1][1] = max(merged[-1][1], end)
-            else:
-                merged.append([start, end])
-        return [(start, end) for start, end in merged]
+    @staticmethod
+    def _decode_mono_16k(audio_path):
+        """
+        Read with soundfile and resample with soxr when needed, skipping
+        librosa's audioread/resample dispatch. librosa.load stays as the
+        fallback for formats libsndfile cannot open.
+        """
+        try:
+            import soundfile as sf
+
+            y, sr = sf.read(audio_path, dtype="float32", always_2d=True)
+            y = y.mean(axis=1) if y.shape[1] > 1 else y[:, 0]
+            if sr != 16000:
+                import soxr
+
+                y = soxr.resample(y, sr, 16000, quality="HQ")
+            return np.ascontiguousarray(y, dtype=np.float32), 16000
+        except Exception as exc:
+            logger.debug(
+                "soundfile decode of %s failed (%s: %s); falling back to librosa.load.",
+                audio_path,
+                type(exc).__name__,
+                exc,
+            )
+        return librosa.load(audio_path, sr=16000, mono=True)
+
+    def _diarization_input(self, audio_path, torch_module):
+        """Build an in-memory pyannote input from the shared decode, or fall back to the path."""
+        try:
+            y, sr = self._load_mono_16k(audio_path)
+        except Exception as exc:
+            logger.warning(
+                "Could not decode %s for diarization (%s: %s); pyannote will read the file.",
+                audio_path,
+                type(exc).__name__,
+                exc,
+            )
+            return audio_path
+        waveform = torch_module.from_numpy(np.ascontiguousarray(y, dtype=np.float32)).unsqueeze(0)
+        return {"waveform": waveform, "sample_rate": sr}
 
     def _detect_speech_intervals(self, audio_path, fast_mode=False):
         """
-        Lightweight VAD pass to skip silence-heavy regions before ASR.
-        Returns (intervals_in_seconds, mono_audio_16k, sample_rate) or (None, None, None) on failure.
+        VAD pass (Silero, energy-based fallback) to skip silence-heavy regions before ASR.
+        Returns (intervals_in_seconds, mono_audio_16k, sample_rate), or (None, None, None)
+        on failure or when the file is short enough that chunking costs more than it saves.
         """
+        duration = self._audio_duration_seconds(audio_path)
+        skip_below = _VAD_MIN_SECONDS if fast_mode else _VAD_MIN_SECONDS_FULL
+        if duration is not None and duration < skip_below:
+            logger.info(
+                "Skipping VAD pre-pass for %.1f s of audio (< %.0f s); transcribing the file directly.",
+                duration,
+                skip_below,
+            )
+            return None, None, None
+
         try:
-            y, sr = librosa.load(audio_path, sr=16000, mono=True)
+            y, sr = self._load_mono_16k(audio_path)
         except Exception as exc:
             logger.warning(
                 "VAD pre-pass failed (%s: %s). Falling back to full-audio transcription.",
@@ -233,30 +459,70 @@ class MikupTranscriber:
             )
             return None, None, None
 
+        y = np.ascontiguousarray(y, dtype=np.float32)
         if y.size == 0:
             return [], y, sr
 
-        top_db = 38 if fast_mode else 35
         min_speech_seconds = 0.5 if fast_mode else 0.2
-        raw_intervals = librosa.effects.split(
-            y,
-            top_db=top_db,
-            frame_length=1024,
-            hop_length=256,
+        raw_intervals = self._silero_speech_samples(y, sr, min_speech_seconds)
+        if raw_intervals is None:
+            raw_intervals = librosa.effects.split(
+                y,
+                top_db=38 if fast_mode else 35,
+                frame_length=1024,
+                hop_length=256,
+            )
+
+        merged = _filter_and_merge_intervals(
+            np.asarray(raw_intervals, dtype=np.int64).reshape(-1, 2),
+            sr,
+            min_speech_seconds,
+            0.10 if fast_mode else 0.15,
         )
+        speech_intervals = [(start, end) for start, end in merged.tolist()]
+        return speech_intervals, y, sr
+
+    @staticmethod
+    def _audio_duration_seconds(audio_path):
+        """Header-only duration via soundfile; None if the format is not readable that way."""
+        try:
+            import soundfile as sf
 
-        speech_intervals = []
-        for start_idx, end_idx in raw_intervals:
-            start = start_idx / sr
-            end = end_idx / sr
-            if (end - start) >= min_speech_seconds:
-                speech_intervals.append((start, end))
+            info = sf.info(str(audio_path))
+        except Exception:
+            return None
+        if info.samplerate <= 0:
+            return None
+        return info.frames / info.samplerate
 
-        speech_intervals = self._merge_intervals(
-            speech_intervals,
-            max_gap=0.10 if fast_mode else 0.15,
+    @staticmethod
+    def _silero_speech_samples(y, sr, min_speech_seconds):
+        """
+        Speech regions as (start_sample, end_sample) pairs from the Silero VAD
+        model bundled with faster-whisper. Returns None when it is unavailable,
+        so the caller can fall back to the energy-based split.
+        """
+        try:
+            from faster_whisper.vad import VadOptions, get_speech_timestamps
+        except ImportError:
+            return None
+
+        vad_options = VadOptions(
+            min_speech_duration_ms=int(min_speech_seconds * 1000),
+            min_silence_duration_ms=100,
+            speech_pad_ms=100,
         )
-        return speech_intervals, y, sr
+        try:
+            # faster-whisper caches the ONNX session, so repeat calls do not reload it.
+            timestamps = get_speech_timestamps(y, vad_options=vad_options, sampling_rate=sr)
+        except Exception as exc:
+            logger.warning(
+                "Silero VAD failed (%s: %s). Falling back to energy-based VAD.",
+                type(exc).__name__,
+                exc,
+            )
+            return None
+        return [(ts["start"], ts["end"]) for ts in timestamps]
 
     def _normalize_transcription_payload(self, payload, engine_name, time_offset=0.0):
         if not isinstance(payload, dict):
@@ -318,21 +584,12 @@ class MikupTranscriber:
         return {"segments": segments, "word_segments": word_segments}
 
     def _mlx_transcribe_kwargs(self, transcribe_fn, model_ref):
+        model_key, accepts_verbose = _resolve_mlx_kwargs_template(transcribe_fn)
         kwargs = {"word_timestamps": True}
-        try:
-            signature = inspect.signature(transcribe_fn)
-            if "path_or_hf_repo" in signature.parameters:
-                kwargs["path_or_hf_repo"] = model_ref
-            elif "model" in signature.parameters:
-                kwargs["model"] = model_ref
-            elif "model_path" in signature.parameters:
-                kwargs["model_path"] = model_ref
-            elif "repo_id" in signature.parameters:
-                kwargs["repo_id"] = model_ref
-            if "verbose" in signature.parameters:
-                kwargs["verbose"] = False
-        except (TypeError, ValueError):
-            kwargs["path_or_hf_repo"] = model_ref
+        if model_key is not None:
+            kwargs[model_key] = model_ref
+        if accepts_verbose:
+            kwargs["verbose"] = False
         return kwargs
 
     @staticmethod
@@ -340,43 +597,101 @@ class MikupTranscriber:
         start_idx = max(0, int(start_sec * sample_rate))
         end_idx = min(audio_data.shape[0], int(end_sec * sample_rate))
         if end_idx <= start_idx:
-            return np.array([], dtype=np.float32)
-        return audio_data[start_idx:end_idx].astype(np.float32, copy=False)
+            return _EMPTY_F32
+        # audio_data is already contiguous float32 (see _detect_speech_intervals); a slice is a view.
+        return audio_data[start_idx:end_idx]
 
     @staticmethod
-    def _call_mlx_transcribe(transcribe_fn, audio_input, kwargs, sample_rate):
+    def _mlx_signature_accepts_ndarray(transcribe_fn):
+        """mlx_whisper.transcribe(audio, ...) takes a path or an array; older wrappers only take paths."""
         try:
+            params = list(inspect.signature(transcribe_fn).parameters)
+        except (TypeError, ValueError):
+            return False
+        return bool(params) and params[0] == "audio"
+
+    @staticmethod
+    def _call_mlx_transcribe(transcribe_fn, audio_input, kwargs, sample_rate, accepts_ndarray=True):
+        if isinstance(audio_input, str) or accepts_ndarray:
             return transcribe_fn(audio_input, **kwargs)
-        except Exception:
-            if isinstance(audio_input, str):
-                raise
-            import soundfile as sf
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            try:
-                sf.write(tmp_path, audio_input, sample_rate)
-                return transcribe_fn(tmp_path, **kwargs)
-            finally:
-                tmp = Path(tmp_path)
-                if tmp.exists():
-                    tmp.unlink()
+        # Path-only builds: one raw float32 write, no int16 conversion pass.
+        import soundfile as sf
+
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
+            tmp_path = tmp_file.name
+        try:
+            sf.write(tmp_path, audio_input, sample_rate, subtype="FLOAT")
+            return transcribe_fn(tmp_path, **kwargs)
+        finally:
+            tmp = Path(tmp_path)
+            if tmp.exists():
+                tmp.unlink()
+
+    def _get_mlx_transcriber(self):
+        """Resolve (transcribe_fn, model_ref, kwargs) once per instance and warm MLX up."""
+        if self._mlx_transcriber is not None:
+            return self._mlx_transcriber
 
-    def _transcribe_with_mlx(
-        self,
-        audio_path,
-        speech_intervals=None,
-        speech_audio=None,
-        speech_sr=16000,
-    ):
         import mlx_whisper
 
         transcribe_fn = getattr(mlx_whisper, "transcribe", None)
         if not callable(transcribe_fn):
             raise RuntimeError("mlx_whisper.transcribe is not available")
 
-        model_ref = self._mlx_model_ref()
+        self._mlx_accepts_ndarray = self._mlx_signature_accepts_ndarray(transcribe_fn)
+        quant = self.mlx_quant
+        model_ref = self._mlx_model_ref(quant)
         kwargs = self._mlx_transcribe_kwargs(transcribe_fn, model_ref)
+        # The warm-up doubles as an availability probe for the quantized checkpoint.
+        if not self._warmup_mlx(transcribe_fn, kwargs, self._mlx_accepts_ndarray) and quant != "fp16":
+            fallback_ref = self._mlx_model_ref("fp16")
+            logger.warning(
+                "mlx-whisper %s model %s could not be loaded; falling back to fp16 (%s).",
+                quant,
+                model_ref,
+                fallback_ref,
+            )
+            quant = "fp16"
+            model_ref = fallback_ref
+            kwargs = self._mlx_transcribe_kwargs(transcribe_fn, model_ref)
+            self._warmup_mlx(transcribe_fn, kwargs, self._mlx_accepts_ndarray)
+
+        logger.info("mlx-whisper precision: %s (%s)", quant, model_ref)
+        self._mlx_transcriber = (transcribe_fn, model_ref, kwargs)
+        return self._mlx_transcriber
+
+    @classmethod
+    def _warmup_mlx(cls, transcribe_fn, kwargs, accepts_ndarray):
+        """
+        One silent 1 s decode so model load and MLX kernel compilation happen
+        before real chunks. Returns False if the model could not be run.
+        """
+        try:
+            cls._call_mlx_transcribe(
+                transcribe_fn,
+                np.zeros(16000, dtype=np.float32),
+                kwargs,
+                16000,
+                accepts_ndarray,
+            )
+        except Exception as exc:
+            logger.warning(
+                "mlx-whisper warm-up failed (%s: %s).",
+                type(exc).__name__,
+                exc,
+            )
+            return False
+        return True
+
+    def _transcribe_with_mlx(
+        self,
+        audio_path,
+        speech_intervals=None,
+        speech_audio=None,
+        speech_sr=16000,
+    ):
+        transcribe_fn, model_ref, kwargs = self._get_mlx_transcriber()
 
         if speech_intervals is not None and speech_audio is not None:
             logger.info(
@@ -384,6 +699,8 @@ class MikupTranscriber:
                 len(speech_intervals),
                 model_ref,
             )
+            # MLX binds its default stream per thread, so chunks stay on the thread
+            # that loaded and warmed the model.
             segments = []
             word_segments = []
             for start_sec, end_sec in speech_intervals:
@@ -395,14 +712,15 @@ class MikupTranscriber:
                     chunk,
                     kwargs,
                     speech_sr,
+                    self._mlx_accepts_ndarray,
                 )
                 normalized = self._normalize_transcription_payload(
                     payload,
                     "mlx-whisper",
                     time_offset=start_sec,
                 )
-                segments.extend(normalized["segments"])
-                word_segments.extend(normalized["word_segments"])
+                segments += normalized["segments"]
+                word_segments += normalized["word_segments"]
             logger.info(
                 "mlx-whisper VAD transcription complete: %d segments, %d words.",
                 len(segments),
@@ -420,12 +738,19 @@ class MikupTranscriber:
         return self._normalize_transcription_payload(payload, "mlx-whisper")
 
     @staticmethod
-    def _append_fw_segments(fw_segments, offset_seconds, segments, word_segments):
+    def _collect_fw_segments(fw_segments, offset_seconds):
+        """
+        Consume a faster-whisper segment iterator in one pass into
+        (segments, word_segments), without holding on to the Segment objects.
+        """
+        skip = MikupTranscriber._should_skip_hallucinated_segment
+        segments = []
+        word_segments = []
         for seg in fw_segments:
             seg_start = float(seg.start) + offset_seconds
             seg_end = float(seg.end) + offset_seconds
             seg_text = seg.text.strip()
-            if MikupTranscriber._should_skip_hallucinated_segment(
+            if skip(
                 text=seg_text,
                 seg_start=seg_start,
                 seg_end=seg_end,
@@ -433,90 +758,112 @@ class MikupTranscriber:
                 avg_logprob=getattr(seg, "avg_logprob", None),
             ):
                 continue
-            segments.append({
-                "start": seg_start,
-                "end": seg_end,
-                "text": seg_text,
-                "speaker": "Dialogue",
-            })
+            segments.append({"start": seg_start, "end": seg_end, "text": seg_text, "speaker": "Dialogue"})
             if seg.words:
-                for word in seg.words:
-                    word_segments.append({
+                word_segments += [
+                    {
                         "word": word.word,
                         "start": float(word.start) + offset_seconds,
                         "end": float(word.end) + offset_seconds,
-                    })
+                    }
+                    for word in seg.words
+                ]
+        return segments, word_segments
 
     @staticmethod
-    def _call_fw_transcribe(model, audio_input, sample_rate):
-        try:
-            return model.transcribe(
-                audio_input,
-                word_timestamps=True,
-                no_speech_threshold=0.6,
-                log_prob_threshold=-1.0,
-                condition_on_previous_text=False,
-            )
-        except Exception:
-            if isinstance(audio_input, str):
-                raise
-            import soundfile as sf
+    def _fw_vad_parameters(fast_mode=False):
+        """Silero settings for faster-whisper's built-in VAD filter."""
+        return {"min_silence_duration_ms": 500 if fast_mode else 200, "threshold": 0.5}
 
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            try:
-                sf.write(tmp_path, audio_input, sample_rate)
-                return model.transcribe(
-                    tmp_path,
-                    word_timestamps=True,
-                    no_speech_threshold=0.6,
-                    log_prob_threshold=-1.0,
-                    condition_on_previous_text=False,
-                )
-            finally:
-                tmp = Path(tmp_path)
-                if tmp.exists():
-                    tmp.unlink()
+    @staticmethod
+    def _call_fw_batched_transcribe(batched_model, audio_input, batch_size, vad_parameters=None):
+        # The pipeline runs Silero itself and batches the resulting speech chunks.
+        return batched_model.transcribe(
+            audio_input,
+            batch_size=batch_size,
+            word_timestamps=True,
+            no_speech_threshold=0.6,
+            log_prob_threshold=-1.0,
+            vad_filter=True,
+            vad_parameters=vad_parameters,
+        )
 
-    def _transcribe_with_faster_whisper(
-        self,
-        audio_path,
-        speech_intervals=None,
-        speech_audio=None,
-        speech_sr=16000,
-    ):
-        from faster_whisper import WhisperModel
+    @staticmethod
+    def _call_fw_transcribe(model, audio_input, vad_parameters=None):
+        # faster-whisper takes a path or a 1-D float32 16 kHz array directly.
+        return model.transcribe(
+            audio_input,
+            word_timestamps=True,
+            no_speech_threshold=0.6,
+            log_prob_threshold=-1.0,
+            condition_on_previous_text=False,
+            vad_filter=True,
+            vad_parameters=vad_parameters,
+        )
 
+    def _get_whisper_model(self):
+        """Return the faster-whisper model, reloading only when model id or device settings change."""
         local_path = _MODELS_DIR / "whisper-small"
         model_id = str(local_path) if (local_path / "model.bin").exists() else self.model_size
+        key = (model_id, self.ct2_device, self.ct2_compute)
+        if self._whisper_model is not None and self._whisper_model_key == key:
+            return self._whisper_model
+
+        from faster_whisper import WhisperModel
+
         logger.info(
             "Loading WhisperModel (%s) on %s / %s...",
             model_id, self.ct2_device, self.ct2_compute,
         )
-        model = WhisperModel(
+        self._whisper_model = WhisperModel(
             model_id,
             device=self.ct2_device,
             compute_type=self.ct2_compute,
         )
+        self._whisper_model_key = key
+        # The batched wrapper holds the previous model; rebuild it on next use.
+        self._batched_whisper_model = None
+        return self._whisper_model
 
-        segments = []
-        word_segments = []
+    def _get_batched_whisper_model(self):
+        """Wrap the cached model in BatchedInferencePipeline, or None if this faster-whisper lacks it."""
+        model = self._get_whisper_model()
+        if self._batched_whisper_model is not None:
+            return self._batched_whisper_model
 
-        if speech_intervals is not None and speech_audio is not None:
-            logger.info(
-                "Transcribing %d VAD speech segment(s) with faster-whisper.",
-                len(speech_intervals),
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.info("faster-whisper BatchedInferencePipeline unavailable; using per-chunk transcription.")
+            return None
+
+        self._batched_whisper_model = BatchedInferencePipeline(model=model)
+        return self._batched_whisper_model
+
+    def _transcribe_with_faster_whisper(self, audio_input, batch_size=16, fast_mode=False):
+        """
+        Transcribe a path or a mono 16 kHz float32 array. Silence is skipped by
+        faster-whisper's own Silero VAD, so no separate pre-pass is needed here.
+        """
+        vad_parameters = self._fw_vad_parameters(fast_mode)
+        batched_model = self._get_batched_whisper_model()
+
+        if batched_model is not None:
+            logger.info("Transcribing with batched faster-whisper (batch_size=%d).", batch_size)
+            fw_segments, _ = self._call_fw_batched_transcribe(
+                batched_model,
+                audio_input,
+                batch_size,
+                vad_parameters=vad_parameters,
             )
-            for start_sec, end_sec in speech_intervals:
-                chunk = self._slice_audio_chunk(speech_audio, speech_sr, start_sec, end_sec)
-                if chunk.size == 0:
-                    continue
-                fw_segments, _ = self._call_fw_transcribe(model, chunk, speech_sr)
-                self._append_fw_segments(fw_segments, start_sec, segments, word_segments)
         else:
-            logger.info("Transcribing with faster-whisper: %s", audio_path)
-            fw_segments, _ = self._call_fw_transcribe(model, audio_path, speech_sr)
-            self._append_fw_segments(fw_segments, 0.0, segments, word_segments)
+            logger.info("Transcribing with faster-whisper.")
+            fw_segments, _ = self._call_fw_transcribe(
+                self._get_whisper_model(),
+                audio_input,
+                vad_parameters=vad_parameters,
+            )
+        segments, word_segments = self._collect_fw_segments(fw_segments, 0.0)
 
         logger.info(
             "faster-whisper transcription complete: %d segments, %d words.",
@@ -528,31 +875,38 @@ class MikupTranscriber:
     def transcribe(self, audio_path, batch_size=16, fast_mode=False):
         """
         Transcribe audio with optional mlx-whisper path on Apple Silicon.
-        batch_size is accepted for API compatibility but not used.
+        The VAD pre-pass only feeds mlx-whisper; faster-whisper filters silence
+        itself. batch_size sets the number of speech windows decoded together
+        by the batched faster-whisper pipeline.
         """
-        del batch_size
-
-        speech_intervals = None
-        speech_audio = None
-        speech_sr = 16000
-
-        if Path(audio_path).exists():
-            speech_intervals, speech_audio, speech_sr = self._detect_speech_intervals(
-                audio_path,
-                fast_mode=fast_mode,
-            )
-            if speech_intervals is not None:
-                logger.info("VAD detected %d speech segment(s).", len(speech_intervals))
-                if not speech_intervals:
-                    logger.info("VAD detected no speech; returning empty transcription.")
-                    return {"segments": [], "word_segments": [], "pacing_mikups": []}
-        else:
-            logger.warning(
-                "Audio path %s does not exist at VAD pre-pass time; using direct transcription path.",
-                audio_path,
-            )
+        try:
+            return self._transcribe(audio_path, batch_size=batch_size, fast_mode=fast_mode)
+        finally:
+            if fast_mode:
+                # Fast mode skips diarization, so nothing else reads the shared decode.
+                self._decoded_audio = None
 
+    def _transcribe(self, audio_path, batch_size, fast_mode):
         if self.prefer_mlx and self.apple_silicon and self.torch_device == "mps":
+            speech_intervals = None
+            speech_audio = None
+            speech_sr = 16000
+            if Path(audio_path).exists():
+                speech_intervals, speech_audio, speech_sr = self._detect_speech_intervals(
+                    audio_path,
+                    fast_mode=fast_mode,
+                )
+                if speech_intervals is not None:
+                    logger.info("VAD detected %d speech segment(s).", len(speech_intervals))
+                    if not speech_intervals:
+                        logger.info("VAD detected no speech; returning empty transcription.")
+                        return {"segments": [], "word_segments": [], "pacing_mikups": []}
+            else:
+                logger.warning(
+                    "Audio path %s does not exist at VAD pre-pass time; using direct transcription path.",
+                    audio_path,
+                )
+
             try:
                 result = self._transcribe_with_mlx(
                     audio_path,
@@ -570,14 +924,29 @@ class MikupTranscriber:
                 )
 
         result = self._transcribe_with_faster_whisper(
-            audio_path,
-            speech_intervals=speech_intervals,
-            speech_audio=speech_audio,
-            speech_sr=speech_sr,
+            self._faster_whisper_input(audio_path),
+            batch_size=batch_size,
+            fast_mode=fast_mode,
         )
         result = self._apply_fallback_speakers(result)
         return self._attach_pacing_mikups(result)
 
+    def _faster_whisper_input(self, audio_path):
+        """The shared 16 kHz decode (reused by diarize()), or the path if it cannot be decoded."""
+        if not Path(audio_path).exists():
+            return str(audio_path)
+        try:
+            y, _ = self._load_mono_16k(audio_path)
+        except Exception as exc:
+            logger.warning(
+                "Could not decode %s (%s: %s); passing the path to faster-whisper.",
+                audio_path,
+                type(exc).__name__,
+                exc,
+            )
+            return str(audio_path)
+        return y
+
     def _coerce_diarization_pipeline_dtype(self, pipeline, torch_module):
         if self.torch_device != "mps":
             return
@@ -597,45 +966,129 @@ class MikupTranscriber:
         else:
             logger.warning("Unable to force diarization model to float16 on MPS; continuing as-is.")
 
+    def prefetch_diarization_pipeline(self, hf_token):
+        """
+        Start loading the pyannote pipeline on a background thread so the load
+        overlaps with transcription. diarize() picks up the result.
+        """
+        if not hf_token or self._diarization_pipeline is not None or self._diarization_prefetch is not None:
+            return
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="mikup-diarization-load")
+        self._diarization_prefetch = executor.submit(self._load_diarization_pipeline, hf_token)
+        executor.shutdown(wait=False)
+
+    def close(self):
+        """
+        Release cached models and the shared decode. A background diarization
+        load is cancelled if it has not started, otherwise awaited, so nothing
+        lands on the GPU after the caller frees memory.
+        """
+        prefetch, self._diarization_prefetch = self._diarization_prefetch, None
+        if prefetch is not None and not prefetch.cancel():
+            try:
+                prefetch.result()
+            except Exception as exc:
+                logger.warning(
+                    "Background diarization load failed during close (%s: %s).",
+                    type(exc).__name__,
+                    exc,
+                )
+        self._diarization_pipeline = None
+        self._whisper_model = None
+        self._whisper_model_key = None
+        self._batched_whisper_model = None
+        self._mlx_transcriber = None
+        self._decoded_audio = None
+
+    def _get_diarization_pipeline(self, hf_token):
+        """Return the pyannote pipeline, loading it on first use."""
+        if self._diarization_pipeline is not None:
+            return self._diarization_pipeline
+
+        if self._diarization_prefetch is not None:
+            prefetch, self._diarization_prefetch = self._diarization_prefetch, None
+            self._diarization_pipeline = prefetch.result()
+        else:
+            self._diarization_pipeline = self._load_diarization_pipeline(hf_token)
+        return self._diarization_pipeline
+
+    def _load_diarization_pipeline(self, hf_token):
+        from pyannote.audio import Pipeline
+        import torch
+
+        logger.info(
+            "Loading pyannote diarization pipeline on %s...", self.torch_device
+        )
+        pipeline = Pipeline.from_pretrained(
+            "pyannote/speaker-diarization-3.1",
+            use_auth_token=hf_token,
+            cache_dir=str(_MODELS_DIR / "pyannote"),
+        )
+        pipeline.to(torch.device(self.torch_device))
+        self._coerce_diarization_pipeline_dtype(pipeline, torch)
+        return pipeline
+
+    def _run_diarization_pipeline(self, pipeline, audio_input, torch_module):
+        """
+        Run pyannote under fp16 autocast on CUDA, rerunning in fp32 if autocast
+        fails. Weights stay fp32 so the fallback needs no reload.
+        """
+        if self.torch_device != "cuda":
+            return pipeline(audio_input)
+
+        try:
+            with torch_module.autocast(device_type="cuda", dtype=torch_module.float16):
+                return pipeline(audio_input)
+        except RuntimeError as exc:
+            logger.warning(
+                "Diarization under fp16 autocast failed (%s: %s); retrying in float32.",
+                type(exc).__name__,
+                exc,
+            )
+            return pipeline(audio_input)
+
     def diarize(self, audio_path, transcription_result, hf_token=None):
         """
         Assign speaker labels to segments using pyannote/speaker-diarization-3.1.
         If hf_token is absent or the pipeline fails, returns result unchanged
-        with fallback labels preserved.
+        with fallback labels preserved. Raises ValueError for a malformed result.
         """
+        try:
+            return self._diarize(audio_path, transcription_result, hf_token)
+        finally:
+            # Diarization is the last consumer of the shared decode.
+            self._decoded_audio = None
+
+    def _diarize(self, audio_path, transcription_result, hf_token):
+        self._require_segments(transcription_result)
         if not hf_token:
             logger.warning("HF_TOKEN not provided. Skipping diarization.")
             transcription_result = self._apply_fallback_speakers(transcription_result)
             return self._attach_pacing_mikups(transcription_result)
 
         try:
-            from pyannote.audio import Pipeline
             import torch
 
-            logger.info(
-                "Loading pyannote diarization pipeline on %s...", self.torch_device
-            )
-            pipeline = Pipeline.from_pretrained(
-                "pyannote/speaker-diarization-3.1",
-                use_auth_token=hf_token,
-                cache_dir=str(_MODELS_DIR / "pyannote"),
-            )
-            pipeline.to(torch.device(self.torch_device))
-            self._coerce_diarization_pipeline_dtype(pipeline, torch)
+            pipeline = self._get_diarization_pipeline(hf_token)
 
             logger.info("Running diarization on: %s", audio_path)
-            diarization = pipeline(audio_path)
-
-            for segment in transcription_result.get("segments", []):
-                if not isinstance(segment, dict):
-                    continue
-                seg_start = segment.get("start")
-                seg_end = segment.get("end")
-                if seg_start is None or seg_end is None:
-                    continue
-                segment["speaker"] = self._assign_speaker(
-                    seg_start, seg_end, diarization
-                )
+            diarization = self._run_diarization_pipeline(
+                pipeline, self._diarization_input(audio_path, torch), torch
+            )
+            turns = self._index_diarization_turns(diarization)
+
+            timed = [
+                segment
+                for segment in transcription_result.get("segments", [])
+                if segment.get("start") is not None and segment.get("end") is not None
+            ]
+            bounds = np.array(
+                [(segment["start"], segment["end"]) for segment in timed],
+                dtype=np.float64,
+            ).reshape(-1, 2)
+            speakers = self._assign_speakers(bounds[:, 0], bounds[:, 1], turns)
+            for segment, speaker in zip(timed, speakers):
+                segment["speaker"] = speaker
 
             logger.info("Diarization complete.")
 
@@ -649,6 +1102,14 @@ class MikupTranscriber:
         return self._attach_pacing_mikups(transcription_result)
 
     def save_results(self, result, output_path):
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        try:
+            import orjson
+        except ImportError:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2, ensure_ascii=False)
+        else:
+            # One bytes blob instead of json.dump's per-token writes; numpy scalars serialize natively.
+            Path(output_path).write_bytes(
+                orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            )
         logger.info("Transcription results saved to %s", output_path)
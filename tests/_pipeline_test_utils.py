@@ -1,6 +1,10 @@
+import atexit
+import functools
 import importlib
 import json
+import shutil
 import sys
+import tempfile
 import types
 from pathlib import Path
 from unittest.mock import patch
@@ -102,6 +106,9 @@ def _install_dependency_stubs() -> None:
             with open(output_path, "w", encoding="utf-8") as file_obj:
                 json.dump(payload, file_obj)
 
+        def close(self):
+            pass
+
     transcriber_mod.MikupTranscriber = MikupTranscriber
     sys.modules["src.transcription.transcriber"] = transcriber_mod
 
@@ -128,13 +135,57 @@ def _install_dependency_stubs() -> None:
     sys.modules["src.llm.director"] = director_mod
 
 
+@functools.lru_cache(maxsize=1)
 def load_main_module():
+    """Import src.main against the dependency stubs once per test process."""
     _install_dependency_stubs()
     if "src.main" in sys.modules:
         del sys.modules["src.main"]
     return importlib.import_module("src.main")
 
 
+@functools.lru_cache(maxsize=1)
+def _scratch_root() -> Path:
+    """One temp root per test process, removed at exit instead of per test."""
+    root = Path(tempfile.mkdtemp(prefix="mikup-tests-"))
+    atexit.register(shutil.rmtree, root, True)
+    return root
+
+
+def scratch_dir(name: str) -> Path:
+    """A fresh directory under the process-wide scratch root."""
+    return Path(tempfile.mkdtemp(prefix=f"{name}-", dir=_scratch_root()))
+
+
+def _rebase_paths(value, old_root: str, new_root: str):
+    if isinstance(value, str) and (value == old_root or value.startswith(old_root + "/")):
+        return new_root + value[len(old_root):]
+    if isinstance(value, dict):
+        return {key: _rebase_paths(item, old_root, new_root) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_rebase_paths(item, old_root, new_root) for item in value]
+    return value
+
+
+def copy_workspace(snapshot: Path, output_dir: Path) -> Path:
+    """Copy a workspace and point its JSON artifacts at the copy, not the snapshot."""
+    shutil.copytree(snapshot, output_dir)
+    for json_path in (output_dir / "data").glob("*.json"):
+        payload = json.loads(json_path.read_text(encoding="utf-8"))
+        rebased = _rebase_paths(payload, str(snapshot), str(output_dir))
+        json_path.write_text(json.dumps(rebased, indent=2), encoding="utf-8")
+    return output_dir
+
+
 def run_main(main_module, args: list[str]):
-    with patch.object(sys, "argv", ["main.py", *args]):
+    # update_history() defaults to the repo's data/history.json; point it at the
+    # per-process scratch root so tests never touch the checkout and parallel
+    # workers never share a file.
+    history_path = str(_scratch_root() / "history.json")
+    with patch.object(sys, "argv", ["main.py", *args]), \
+            patch.object(
+                main_module,
+                "update_history",
+                functools.partial(main_module.update_history, history_path=history_path),
+            ):
         return main_module.main()
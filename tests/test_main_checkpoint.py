@@ -1,9 +1,11 @@
+import importlib.util
 import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
-from tests._pipeline_test_utils import load_main_module, run_main
+from tests._pipeline_test_utils import copy_workspace, load_main_module, run_main, scratch_dir
 
 
 def _read_json(path: Path):
@@ -15,6 +17,20 @@ class MainCheckpointSmokeTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.main_module = load_main_module()
+        # Run separation once; tests that continue from it copy this snapshot.
+        cls._separated_dir = scratch_dir("separated") / "workspace"
+        run_main(
+            cls.main_module,
+            [
+                "--input",
+                "dummy.wav",
+                "--mock",
+                "--output-dir",
+                str(cls._separated_dir),
+                "--stage",
+                "separation",
+            ],
+        )
 
     def test_mock_full_pipeline_writes_artifacts_under_data(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -57,52 +73,110 @@ class MainCheckpointSmokeTests(unittest.TestCase):
                 self.assertIs(state["stages"][stage]["completed"], True)
 
     def test_manual_stage_progression_updates_checkpoint_state(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir) / "workspace"
-
-            run_main(
-                self.main_module,
-                [
-                    "--input",
-                    "dummy.wav",
-                    "--mock",
-                    "--output-dir",
-                    str(output_dir),
-                    "--stage",
-                    "separation",
-                ],
-            )
-
-            run_main(
-                self.main_module,
-                [
-                    "--input",
-                    "dummy.wav",
-                    "--mock",
-                    "--output-dir",
-                    str(output_dir),
-                    "--stage",
-                    "transcription",
-                ],
-            )
-
-            run_main(
-                self.main_module,
-                [
-                    "--input",
-                    "dummy.wav",
-                    "--mock",
-                    "--output-dir",
-                    str(output_dir),
-                    "--stage",
-                    "dsp",
-                ],
-            )
-
-            state = _read_json(output_dir / "data" / "stage_state.json")
-            self.assertIs(state["stages"]["separation"]["completed"], True)
-            self.assertIs(state["stages"]["transcription"]["completed"], True)
-            self.assertIs(state["stages"]["dsp"]["completed"], True)
+        output_dir = scratch_dir("stage-progression") / "workspace"
+        copy_workspace(self._separated_dir, output_dir)
+
+        run_main(
+            self.main_module,
+            [
+                "--input",
+                "dummy.wav",
+                "--mock",
+                "--output-dir",
+                str(output_dir),
+                "--stage",
+                "transcription",
+            ],
+        )
+
+        run_main(
+            self.main_module,
+            [
+                "--input",
+                "dummy.wav",
+                "--mock",
+                "--output-dir",
+                str(output_dir),
+                "--stage",
+                "dsp",
+            ],
+        )
+
+        state = _read_json(output_dir / "data" / "stage_state.json")
+        stems = _read_json(output_dir / "data" / "stems.json")
+        self.assertEqual(Path(stems["DX"]).parent, output_dir)
+        self.assertEqual(
+            state["stages"]["separation"]["artifacts"]["stems"],
+            str(output_dir / "data" / "stems.json"),
+        )
+        self.assertIs(state["stages"]["separation"]["completed"], True)
+        self.assertIs(state["stages"]["transcription"]["completed"], True)
+        self.assertIs(state["stages"]["dsp"]["completed"], True)
+
+    def test_mock_stems_writes_one_wav_and_copies_the_rest(self):
+        template = b"RIFF-template"
+        written = []
+
+        def record(path, **_):
+            written.append(path)
+            Path(path).write_bytes(template)
+
+        temp_dir = scratch_dir("mock-stems")
+        with patch.object(self.main_module, "_write_silent_wav", record):
+            existing = temp_dir / "dummy_Music.wav"
+            existing.write_bytes(b"keep")
+
+            stems = self.main_module._mock_stems(temp_dir, "dummy.wav")
+
+            self.assertEqual(set(stems), {"DX", "Music", "Effects", "DX_Residual"})
+            self.assertEqual(len(written), 1)
+            for key in ("DX", "Effects", "DX_Residual"):
+                self.assertEqual(Path(stems[key]).read_bytes(), template)
+            self.assertEqual(existing.read_bytes(), b"keep")
+
+    @unittest.skipUnless(importlib.util.find_spec("orjson"), "orjson is not installed")
+    def test_json_round_trip_with_orjson_handles_numpy_and_int_keys(self):
+        import numpy as np
+
+        path = scratch_dir("orjson-round-trip") / "data" / "stage_state.json"
+        self.main_module._write_json_file(
+            str(path),
+            {"peak": np.float32(0.5), "frames": np.int64(3), 1: "first"},
+        )
+
+        self.assertEqual(
+            self.main_module._read_json_file(str(path)),
+            {"peak": 0.5, "frames": 3, "1": "first"},
+        )
+        self.assertEqual(json.loads(path.read_text(encoding="utf-8"))["frames"], 3)
+
+    def test_json_round_trip_keeps_non_finite_floats(self):
+        temp_dir = scratch_dir("non-finite")
+        legacy = temp_dir / "mikup_payload.json"
+        legacy.write_text('{"lufs": -Infinity}', encoding="utf-8")
+        path = temp_dir / "data" / "semantics.json"
+        self.main_module._write_json_file(str(path), [{"score": float("nan")}])
+
+        self.assertEqual(self.main_module._read_json_file(str(legacy)), {"lufs": float("-inf")})
+        self.assertIn("NaN", path.read_text(encoding="utf-8"))
+
+    def test_artifact_check_is_reused_until_the_file_changes(self):
+        calls = []
+
+        def check(payload):
+            calls.append(payload)
+            return isinstance(payload, dict)
+
+        path = scratch_dir("artifact-check") / "transcription.json"
+        path.write_text('{"segments": []}', encoding="utf-8")
+
+        self.assertTrue(self.main_module._cached_artifact_check(str(path), check))
+        self.assertTrue(self.main_module._cached_artifact_check(str(path), check))
+        self.assertEqual(len(calls), 1)
+
+        path.write_text("[1, 2, 3]", encoding="utf-8")
+        self.assertFalse(self.main_module._cached_artifact_check(str(path), check))
+        self.assertEqual(len(calls), 2)
 
 
 if __name__ == "__main__":
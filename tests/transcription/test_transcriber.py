@@ -2,13 +2,19 @@ import importlib
 import json
 import sys
 import tempfile
+import threading
+import types
 import unittest
 from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
 
 sys.modules.pop("src.transcription.transcriber", None)
-MikupTranscriber = importlib.import_module("src.transcription.transcriber").MikupTranscriber
+transcriber_module = importlib.import_module("src.transcription.transcriber")
+MikupTranscriber = transcriber_module.MikupTranscriber
 
-from tests._pipeline_test_utils import load_main_module, run_main
+from tests._pipeline_test_utils import copy_workspace, load_main_module, run_main, scratch_dir
 
 
 class FallbackSpeakerAssignmentTests(unittest.TestCase):
@@ -58,10 +64,673 @@ class FallbackSpeakerAssignmentTests(unittest.TestCase):
         self.assertEqual(speakers, ["Speaker 1", "Speaker 2"])
 
 
+class PacingMikupTests(unittest.TestCase):
+    def test_build_pacing_mikups_reports_gaps_above_threshold(self):
+        payload = {
+            "segments": [
+                {"start": 3.0, "end": 4.0, "speaker": "SPEAKER_01"},
+                {"start": 0.0, "end": 1.0, "speaker": "SPEAKER_00"},
+                {"start": 1.05, "end": 2.5, "speaker": None},
+                {"start": "bad", "end": 9.0},
+            ]
+        }
+
+        pacing = MikupTranscriber._build_pacing_mikups(payload)
+
+        self.assertEqual(
+            pacing,
+            [
+                {
+                    "timestamp": 2.5,
+                    "duration_ms": 500,
+                    "context": "Between [Dialogue] and [SPEAKER_01]",
+                }
+            ],
+        )
+
+    def test_build_pacing_mikups_needs_two_segments(self):
+        payload = {"segments": [{"start": 0.0, "end": 1.0}]}
+        self.assertEqual(MikupTranscriber._build_pacing_mikups(payload), [])
+
+    def test_malformed_segments_are_rejected_at_the_gate(self):
+        transcriber = _make_transcriber()
+        payload = {"segments": [{"start": 0.0, "end": 1.0}, "not a segment"]}
+
+        self.assertFalse(MikupTranscriber._segments_ok(payload))
+        self.assertFalse(MikupTranscriber._segments_ok([]))
+        with self.assertRaises(ValueError):
+            transcriber.diarize("dialogue.wav", payload, hf_token=None)
+
+
+class FakeTurn:
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+
+class FakeDiarization:
+    def __init__(self, tracks):
+        self._tracks = tracks
+
+    def itertracks(self, yield_label=False):
+        for start, end, speaker in self._tracks:
+            yield FakeTurn(start, end), None, speaker
+
+
+def _assign(seg_start, seg_end, tracks):
+    turns = MikupTranscriber._index_diarization_turns(FakeDiarization(tracks))
+    return MikupTranscriber._assign_speaker(seg_start, seg_end, turns)
+
+
+class AssignSpeakerTests(unittest.TestCase):
+    def test_single_speaker_full_overlap(self):
+        self.assertEqual(_assign(1.0, 2.0, [(0.0, 5.0, "SPEAKER_00")]), "SPEAKER_00")
+
+    def test_no_overlap_falls_back_to_dialogue(self):
+        self.assertEqual(_assign(6.0, 7.0, [(0.0, 5.0, "SPEAKER_00")]), "Dialogue")
+        self.assertEqual(_assign(1.0, 2.0, []), "Dialogue")
+
+    def test_overlap_is_summed_per_speaker(self):
+        tracks = [
+            (0.0, 1.0, "SPEAKER_00"),
+            (1.0, 1.8, "SPEAKER_01"),
+            (1.8, 2.6, "SPEAKER_00"),
+            (2.6, 3.0, "SPEAKER_01"),
+        ]
+        # SPEAKER_00: 0.5 + 0.8, SPEAKER_01: 0.8 + 0.4
+        self.assertEqual(_assign(0.5, 3.0, tracks), "SPEAKER_00")
+
+    def test_long_turn_starting_early_is_still_found(self):
+        tracks = [
+            (0.0, 100.0, "SPEAKER_00"),
+            (10.0, 11.0, "SPEAKER_01"),
+            (20.0, 21.0, "SPEAKER_01"),
+        ]
+        self.assertEqual(_assign(50.0, 52.0, tracks), "SPEAKER_00")
+
+    def test_unsorted_turns_are_indexed_by_start(self):
+        tracks = [(5.0, 6.0, "SPEAKER_01"), (0.0, 1.0, "SPEAKER_00")]
+        self.assertEqual(_assign(0.2, 0.8, tracks), "SPEAKER_00")
+        self.assertEqual(_assign(5.2, 5.8, tracks), "SPEAKER_01")
+
+    def test_single_turn_shortcut(self):
+        turns = MikupTranscriber._index_diarization_turns(FakeDiarization([(1.0, 3.0, "SPEAKER_07")]))
+
+        self.assertEqual(
+            MikupTranscriber._assign_speakers(np.array([0.0, 2.0, 3.0]), np.array([1.0, 2.5, 4.0]), turns),
+            ["Dialogue", "SPEAKER_07", "Dialogue"],
+        )
+
+    def test_batched_assignment_matches_per_segment_lookup(self):
+        tracks = [(0.0, 2.0, "SPEAKER_00"), (2.0, 4.0, "SPEAKER_01"), (10.0, 12.0, "SPEAKER_00")]
+        turns = MikupTranscriber._index_diarization_turns(FakeDiarization(tracks))
+        starts = np.array([0.5, 1.5, 5.0, 10.5])
+        ends = np.array([1.5, 3.8, 6.0, 11.0])
+
+        self.assertEqual(
+            MikupTranscriber._assign_speakers(starts, ends, turns),
+            ["SPEAKER_00", "SPEAKER_01", "Dialogue", "SPEAKER_00"],
+        )
+
+
+class DetectDevicesTests(unittest.TestCase):
+    def setUp(self):
+        transcriber_module._detect_devices.cache_clear()
+        self.addCleanup(transcriber_module._detect_devices.cache_clear)
+
+    def _fake_torch(self, cuda=False, mps=False, probes=None):
+        def probe(result):
+            def is_available():
+                if probes is not None:
+                    probes.append(result)
+                return result
+            return is_available
+
+        return types.SimpleNamespace(
+            cuda=types.SimpleNamespace(is_available=probe(cuda)),
+            backends=types.SimpleNamespace(mps=types.SimpleNamespace(is_available=probe(mps))),
+        )
+
+    def test_device_matrix(self):
+        cases = [
+            (False, False, ("cpu", "int8", "cpu")),
+            (True, False, ("cuda", "float16", "cuda")),
+            (True, True, ("cuda", "float16", "cuda")),
+            # CTranslate2 has no MPS backend, so only pyannote moves to MPS.
+            (False, True, ("cpu", "int8", "mps")),
+        ]
+        for cuda, mps, expected in cases:
+            with self.subTest(cuda=cuda, mps=mps):
+                transcriber_module._detect_devices.cache_clear()
+                with patch.dict(sys.modules, {"torch": self._fake_torch(cuda=cuda, mps=mps)}):
+                    self.assertEqual(transcriber_module._detect_devices(), expected)
+
+    def test_devices_are_probed_once(self):
+        probes = []
+        with patch.dict(sys.modules, {"torch": self._fake_torch(cuda=True, probes=probes)}):
+            transcriber_module._detect_devices()
+            transcriber_module._detect_devices()
+
+        self.assertEqual(probes, [True])
+
+
+def _make_transcriber(devices=("cpu", "int8", "cpu")):
+    with patch.object(transcriber_module, "_detect_devices", lambda: devices):
+        return MikupTranscriber(prefer_mlx=False)
+
+
+def _fake_faster_whisper(created=None, batched_pipeline=None):
+    """A stand-in faster_whisper module whose WhisperModel records its settings."""
+
+    class FakeWhisperModel:
+        def __init__(self, model_id, device, compute_type):
+            if created is not None:
+                created.append((model_id, device, compute_type))
+
+    fake_module = types.ModuleType("faster_whisper")
+    fake_module.WhisperModel = FakeWhisperModel
+    if batched_pipeline is not None:
+        fake_module.BatchedInferencePipeline = batched_pipeline
+    return fake_module
+
+
+class ModelCacheTests(unittest.TestCase):
+    def test_whisper_model_is_loaded_once_per_instance(self):
+        created = []
+        transcriber = _make_transcriber()
+
+        with patch.dict(sys.modules, {"faster_whisper": _fake_faster_whisper(created)}):
+            first = transcriber._get_whisper_model()
+            second = transcriber._get_whisper_model()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(created), 1)
+
+    def test_whisper_model_reloads_when_compute_settings_change(self):
+        created = []
+        transcriber = _make_transcriber()
+
+        with patch.dict(sys.modules, {"faster_whisper": _fake_faster_whisper(created)}):
+            first = transcriber._get_whisper_model()
+            transcriber.ct2_compute = "int8_float32"
+            second = transcriber._get_whisper_model()
+
+        self.assertIsNot(first, second)
+        self.assertEqual([entry[2] for entry in created], ["int8", "int8_float32"])
+
+    def test_mlx_transcriber_is_resolved_and_warmed_once(self):
+        calls = []
+
+        def transcribe(audio, path_or_hf_repo=None, word_timestamps=False, verbose=None):
+            calls.append(audio)
+            return {"segments": []}
+
+        fake_module = types.ModuleType("mlx_whisper")
+        fake_module.transcribe = transcribe
+        transcriber = _make_transcriber()
+
+        with patch.dict(sys.modules, {"mlx_whisper": fake_module}):
+            first = transcriber._get_mlx_transcriber()
+            second = transcriber._get_mlx_transcriber()
+
+        self.assertIs(first, second)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(calls[0].shape, (16000,))
+
+    def test_mlx_quantized_model_falls_back_to_fp16_when_missing(self):
+        refs = []
+
+        def transcribe(audio, path_or_hf_repo=None, word_timestamps=False, verbose=None):
+            refs.append(path_or_hf_repo)
+            if path_or_hf_repo.endswith("-q4"):
+                raise FileNotFoundError(path_or_hf_repo)
+            return {"segments": []}
+
+        fake_module = types.ModuleType("mlx_whisper")
+        fake_module.transcribe = transcribe
+        transcriber = _make_transcriber()
+        transcriber.mlx_quant = "q4"
+
+        with patch.dict(sys.modules, {"mlx_whisper": fake_module}), \
+                patch.object(transcriber_module, "_MODELS_DIR", Path("/nonexistent-models")):
+            _, model_ref, kwargs = transcriber._get_mlx_transcriber()
+
+        self.assertEqual(refs, ["mlx-community/whisper-small-mlx-q4", "mlx-community/whisper-small-mlx"])
+        self.assertEqual(model_ref, "mlx-community/whisper-small-mlx")
+        self.assertEqual(kwargs["path_or_hf_repo"], model_ref)
+
+    def test_mlx_local_fp16_dir_is_not_used_for_quantized_precision(self):
+        transcriber = _make_transcriber()
+
+        models_dir = scratch_dir("mlx-models")
+        (models_dir / "whisper-small-mlx").mkdir()
+        with patch.object(transcriber_module, "_MODELS_DIR", models_dir):
+            q4_ref = transcriber._mlx_model_ref("q4")
+            fp16_ref = transcriber._mlx_model_ref("fp16")
+
+        self.assertEqual(q4_ref, "mlx-community/whisper-small-mlx-q4")
+        self.assertEqual(fp16_ref, str(models_dir / "whisper-small-mlx"))
+
+    def test_mlx_quant_env_value_is_validated(self):
+        with patch.dict("os.environ", {"MIKUP_MLX_QUANT": "Q8"}):
+            self.assertEqual(transcriber_module._mlx_quant_from_env(), "q8")
+        with patch.dict("os.environ", {"MIKUP_MLX_QUANT": "int3"}):
+            self.assertEqual(transcriber_module._mlx_quant_from_env(), "q4")
+
+    def test_mlx_path_only_build_gets_float32_wav(self):
+        import soundfile as sf
+
+        seen = {}
+
+        def transcribe(path_or_audio, path_or_hf_repo=None):
+            seen["subtype"] = sf.info(path_or_audio).subtype
+            return {"segments": []}
+
+        self.assertFalse(MikupTranscriber._mlx_signature_accepts_ndarray(transcribe))
+        MikupTranscriber._call_mlx_transcribe(
+            transcribe,
+            np.zeros(1600, dtype=np.float32),
+            {},
+            16000,
+            accepts_ndarray=False,
+        )
+        self.assertEqual(seen["subtype"], "FLOAT")
+
+    def test_mlx_vad_chunks_keep_order_and_offsets(self):
+        threads = []
+
+        def transcribe(audio, path_or_hf_repo=None):
+            threads.append(threading.get_ident())
+            return {"segments": [{"start": 0.0, "end": audio.size / 16000, "text": f"n{audio.size}"}]}
+
+        transcriber = _make_transcriber()
+        transcriber._mlx_transcriber = (transcribe, "model", {"path_or_hf_repo": "model"})
+        audio = np.ones(16000 * 10, dtype=np.float32)
+
+        result = transcriber._transcribe_with_mlx(
+            "unused.wav",
+            speech_intervals=[(1.0, 2.0), (4.0, 4.0), (5.0, 7.0), (8.0, 8.5)],
+            speech_audio=audio,
+        )
+
+        self.assertEqual(
+            [(seg["start"], seg["end"], seg["text"]) for seg in result["segments"]],
+            [(1.0, 2.0, "n16000"), (5.0, 7.0, "n32000"), (8.0, 8.5, "n8000")],
+        )
+        # MLX streams are per-thread; chunks must run where the model was warmed.
+        self.assertEqual(set(threads), {threading.get_ident()})
+
+    def test_close_after_failed_transcribe_waits_for_prefetch_and_drops_models(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_load(hf_token):
+            started.set()
+            release.wait(5)
+            return object()
+
+        def failing_transcribe(audio_input, **kwargs):
+            raise RuntimeError("boom")
+
+        transcriber = _make_transcriber()
+        transcriber._whisper_model = object()
+        with patch.object(transcriber, "_load_diarization_pipeline", slow_load), \
+                patch.object(transcriber, "_transcribe_with_faster_whisper", failing_transcribe):
+            transcriber.prefetch_diarization_pipeline("hf-token")
+            prefetch = transcriber._diarization_prefetch
+            self.assertTrue(started.wait(5))
+            with self.assertRaises(RuntimeError):
+                transcriber.transcribe("missing.wav")
+
+            closer = threading.Thread(target=transcriber.close)
+            closer.start()
+            closer.join(0.05)
+            # close() must not return while pyannote is still loading.
+            self.assertTrue(closer.is_alive())
+            release.set()
+            closer.join(5)
+
+        self.assertFalse(closer.is_alive())
+        self.assertTrue(prefetch.done())
+        self.assertIsNone(transcriber._diarization_prefetch)
+        self.assertIsNone(transcriber._diarization_pipeline)
+        self.assertIsNone(transcriber._whisper_model)
+
+    def test_diarization_pipeline_uses_background_prefetch(self):
+        transcriber = _make_transcriber()
+        pipeline = object()
+        tokens = []
+
+        def load(hf_token):
+            tokens.append(hf_token)
+            return pipeline
+
+        with patch.object(transcriber, "_load_diarization_pipeline", load):
+            transcriber.prefetch_diarization_pipeline("hf-token")
+            first = transcriber._get_diarization_pipeline("hf-token")
+            second = transcriber._get_diarization_pipeline("hf-token")
+
+        self.assertIs(first, pipeline)
+        self.assertIs(second, pipeline)
+        self.assertEqual(tokens, ["hf-token"])
+
+    def test_prefetch_is_skipped_without_token(self):
+        transcriber = _make_transcriber()
+        transcriber.prefetch_diarization_pipeline(None)
+        self.assertIsNone(transcriber._diarization_prefetch)
+
+
+class FakeDiarizationPipeline:
+    """Returns (or raises) the queued results in order and records each input."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def __call__(self, audio_input):
+        self.calls.append(audio_input)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class DiarizationAutocastTests(unittest.TestCase):
+    def _fake_torch(self, autocast_calls):
+        class Autocast:
+            def __init__(self, device_type, dtype):
+                autocast_calls.append((device_type, dtype))
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                return False
+
+        return types.SimpleNamespace(autocast=Autocast, float16="float16")
+
+    def test_cuda_runs_pipeline_under_fp16_autocast(self):
+        autocast_calls = []
+        transcriber = _make_transcriber(devices=("cuda", "float16", "cuda"))
+        pipeline = FakeDiarizationPipeline("diarization")
+
+        result = transcriber._run_diarization_pipeline(pipeline, "input", self._fake_torch(autocast_calls))
+
+        self.assertEqual(result, "diarization")
+        self.assertEqual(autocast_calls, [("cuda", "float16")])
+        self.assertEqual(pipeline.calls, ["input"])
+
+    def test_cuda_autocast_failure_reruns_in_fp32(self):
+        autocast_calls = []
+        transcriber = _make_transcriber(devices=("cuda", "float16", "cuda"))
+        pipeline = FakeDiarizationPipeline(RuntimeError("half overflow"), "diarization")
+
+        result = transcriber._run_diarization_pipeline(pipeline, "input", self._fake_torch(autocast_calls))
+
+        self.assertEqual(result, "diarization")
+        self.assertEqual(pipeline.calls, ["input", "input"])
+
+    def test_cpu_skips_autocast(self):
+        autocast_calls = []
+        transcriber = _make_transcriber()
+        pipeline = FakeDiarizationPipeline("diarization")
+
+        transcriber._run_diarization_pipeline(pipeline, "input", self._fake_torch(autocast_calls))
+
+        self.assertEqual(autocast_calls, [])
+
+
+class FasterWhisperVadTests(unittest.TestCase):
+    def test_batched_pipeline_uses_builtin_vad(self):
+        calls = []
+
+        class FakeBatchedPipeline:
+            def __init__(self, model):
+                self.model = model
+
+            def transcribe(self, audio, **kwargs):
+                calls.append(kwargs)
+                segment = types.SimpleNamespace(
+                    start=2.0,
+                    end=3.5,
+                    text=" hello there ",
+                    words=[types.SimpleNamespace(word="hello", start=2.0, end=2.5)],
+                    no_speech_prob=0.1,
+                    avg_logprob=-0.2,
+                )
+                return iter([segment]), None
+
+        fake_module = _fake_faster_whisper(batched_pipeline=FakeBatchedPipeline)
+        transcriber = _make_transcriber()
+
+        with patch.dict(sys.modules, {"faster_whisper": fake_module}):
+            result = transcriber._transcribe_with_faster_whisper(
+                "dialogue.wav",
+                batch_size=8,
+                fast_mode=True,
+            )
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(calls[0]["vad_filter"])
+        self.assertEqual(
+            calls[0]["vad_parameters"],
+            {"min_silence_duration_ms": 500, "threshold": 0.5},
+        )
+        self.assertEqual(calls[0]["batch_size"], 8)
+        self.assertEqual(result["segments"][0]["start"], 2.0)
+        self.assertEqual(result["segments"][0]["text"], "hello there")
+        self.assertEqual(result["word_segments"], [{"word": "hello", "start": 2.0, "end": 2.5}])
+
+    def test_transcribe_skips_vad_pre_pass_and_shares_decode(self):
+        transcriber = _make_transcriber()
+        decoded = np.zeros(16000, dtype=np.float32)
+        vad_calls = []
+        fw_calls = []
+
+        def detect(audio_path, **kwargs):
+            vad_calls.append(audio_path)
+            return None, None, None
+
+        def fw_transcribe(audio_input, **kwargs):
+            fw_calls.append((audio_input, kwargs))
+            return {"segments": [], "word_segments": []}
+
+        with tempfile.NamedTemporaryFile(suffix=".wav") as handle, \
+                patch.object(transcriber, "_detect_speech_intervals", detect), \
+                patch.object(transcriber, "_load_mono_16k", lambda audio_path: (decoded, 16000)), \
+                patch.object(transcriber, "_transcribe_with_faster_whisper", fw_transcribe):
+            transcriber.transcribe(handle.name, fast_mode=True)
+
+        self.assertEqual(vad_calls, [])
+        self.assertEqual(len(fw_calls), 1)
+        self.assertIs(fw_calls[0][0], decoded)
+        self.assertTrue(fw_calls[0][1]["fast_mode"])
+
+    def test_collect_fw_segments_offsets_and_drops_hallucinations(self):
+        ns = types.SimpleNamespace
+        fw_segments = iter([
+            ns(start=0.0, end=1.0, text=" hi ", words=[ns(word="hi", start=0.1, end=0.4)]),
+            ns(start=1.0, end=1.5, text="you", words=[ns(word="you", start=1.0, end=1.4)]),
+            ns(start=2.0, end=3.0, text="there", words=None, no_speech_prob=0.1),
+        ])
+
+        segments, word_segments = MikupTranscriber._collect_fw_segments(fw_segments, 10.0)
+
+        self.assertEqual([(seg["start"], seg["text"]) for seg in segments], [(10.0, "hi"), (12.0, "there")])
+        self.assertEqual(word_segments, [{"word": "hi", "start": 10.1, "end": 10.4}])
+
+
+class SharedDecodeTests(unittest.TestCase):
+    def test_load_mono_16k_decodes_each_file_once(self):
+        transcriber = _make_transcriber()
+        decoded = ([0.0, 0.1], 16000)
+
+        loaded = []
+
+        def load(path, **kwargs):
+            loaded.append(path)
+            return decoded
+
+        with patch.object(transcriber_module, "librosa", types.SimpleNamespace(load=load)):
+            transcriber._load_mono_16k("dialogue.wav")
+            transcriber._load_mono_16k("dialogue.wav")
+            transcriber._load_mono_16k("other.wav")
+
+        self.assertEqual(loaded, ["dialogue.wav", "other.wav"])
+
+    def test_load_mono_16k_decodes_again_after_the_file_is_rewritten(self):
+        transcriber = _make_transcriber()
+
+        wav_path = scratch_dir("decode-cache") / "dialogue.wav"
+        wav_path.write_bytes(b"first")
+        decoded = []
+
+        def decode(audio_path):
+            decoded.append(audio_path)
+            return [0.0], 16000
+
+        with patch.object(transcriber, "_decode_mono_16k", decode):
+            transcriber._load_mono_16k(str(wav_path))
+            transcriber._load_mono_16k(str(wav_path))
+            wav_path.write_bytes(b"rewritten")
+            transcriber._load_mono_16k(str(wav_path))
+
+        self.assertEqual(decoded, [str(wav_path), str(wav_path)])
+
+    def test_diarize_without_token_releases_the_shared_decode(self):
+        transcriber = _make_transcriber()
+        transcriber._decoded_audio = (("dialogue.wav", None, None), [0.0], 16000)
+
+        transcriber.diarize("dialogue.wav", {"segments": []}, hf_token=None)
+
+        self.assertIsNone(transcriber._decoded_audio)
+
+    def test_fast_transcribe_releases_the_shared_decode(self):
+        transcriber = _make_transcriber()
+
+        def fake_transcribe(audio_input, **kwargs):
+            transcriber._decoded_audio = (("dialogue.wav", None, None), [0.0], 16000)
+            return {"segments": []}
+
+        with patch.object(transcriber, "_transcribe_with_faster_whisper", fake_transcribe):
+            transcriber.transcribe("dialogue.wav", fast_mode=True)
+
+        self.assertIsNone(transcriber._decoded_audio)
+
+    def test_decode_mono_16k_downmixes_and_resamples_wav(self):
+        import soundfile as sf
+
+        wav_path = scratch_dir("decode") / "stereo_44k.wav"
+        sf.write(wav_path, np.full((44100, 2), 0.25, dtype=np.float32), 44100)
+
+        y, sr = MikupTranscriber._decode_mono_16k(str(wav_path))
+
+        self.assertEqual(sr, 16000)
+        self.assertEqual(y.dtype, np.float32)
+        self.assertEqual(y.ndim, 1)
+        self.assertAlmostEqual(y.shape[0], 16000, delta=1)
+
+
+class SpeechDetectionTests(unittest.TestCase):
+    def test_detect_speech_intervals_uses_silero_timestamps(self):
+        captured = {}
+
+        class FakeVadOptions:
+            def __init__(self, **kwargs):
+                captured["options"] = kwargs
+
+        def get_speech_timestamps(audio, vad_options=None, sampling_rate=16000):
+            return [
+                {"start": 0, "end": 16000},
+                {"start": 17000, "end": 32000},
+                {"start": 48000, "end": 49000},
+            ]
+
+        fake_vad = types.ModuleType("faster_whisper.vad")
+        fake_vad.VadOptions = FakeVadOptions
+        fake_vad.get_speech_timestamps = get_speech_timestamps
+        fake_package = types.ModuleType("faster_whisper")
+        fake_package.vad = fake_vad
+        transcriber = _make_transcriber()
+        audio = np.zeros(16000 * 4, dtype=np.float32)
+
+        with patch.dict(sys.modules, {"faster_whisper": fake_package, "faster_whisper.vad": fake_vad}), \
+                patch.object(transcriber, "_load_mono_16k", lambda audio_path: (audio, 16000)):
+            intervals, speech_audio, sr = transcriber._detect_speech_intervals("dialogue.wav")
+
+        # 1.0 -> 1.0625 s gap is merged; the 62.5 ms blip at 3 s is shorter than 0.2 s.
+        self.assertEqual(intervals, [(0.0, 2.0)])
+        self.assertIs(speech_audio, audio)
+        self.assertEqual(sr, 16000)
+        self.assertEqual(captured["options"]["min_speech_duration_ms"], 200)
+
+    def test_short_audio_skips_vad_without_decoding(self):
+        import soundfile as sf
+
+        transcriber = _make_transcriber()
+        wav_path = scratch_dir("short-audio") / "short.wav"
+        sf.write(wav_path, np.zeros(16000 * 5, dtype=np.float32), 16000)
+
+        decoded = []
+        with patch.object(transcriber, "_load_mono_16k", decoded.append):
+            result = transcriber._detect_speech_intervals(str(wav_path), fast_mode=True)
+
+        self.assertEqual(result, (None, None, None))
+        self.assertEqual(decoded, [])
+
+
+class IntervalMergeTests(unittest.TestCase):
+    def test_filter_and_merge_drops_short_and_merges_close_regions(self):
+        raw = np.array(
+            [[0, 1600], [1800, 8000], [9000, 9500], [20000, 24000], [24100, 23000]],
+            dtype=np.int64,
+        )
+
+        merged = transcriber_module._filter_and_merge_intervals(raw, 16000, 0.05, 0.15)
+
+        # [0.0, 0.1] + [0.1125, 0.5] merge; [0.5625, 0.59375] is too short;
+        # the reversed last row is dropped as non-positive.
+        self.assertEqual(merged.tolist(), [[0.0, 0.5], [1.25, 1.5]])
+
+    def test_filter_and_merge_handles_empty_input(self):
+        merged = transcriber_module._filter_and_merge_intervals(
+            np.empty((0, 2), dtype=np.int64), 16000, 0.2, 0.15
+        )
+        self.assertEqual(merged.shape, (0, 2))
+
+
+class SaveResultsTests(unittest.TestCase):
+    def test_save_results_falls_back_to_json_without_orjson(self):
+        transcriber = _make_transcriber()
+        payload = {"segments": [{"start": 0.0, "end": 1.0, "text": "café", "speaker": "Dialogue"}]}
+
+        output_path = scratch_dir("save-results") / "transcription.json"
+        with patch.dict(sys.modules, {"orjson": None}):
+            transcriber.save_results(payload, str(output_path))
+            raw = output_path.read_text(encoding="utf-8")
+
+        self.assertIn("café", raw)
+        self.assertEqual(json.loads(raw), payload)
+
+
 class TranscriptionStageSmokeTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         cls.main_module = load_main_module()
+        # Run separation once; tests that continue from it copy this snapshot.
+        cls._separated_dir = scratch_dir("separated") / "workspace"
+        run_main(
+            cls.main_module,
+            [
+                "--input",
+                "dummy.wav",
+                "--mock",
+                "--output-dir",
+                str(cls._separated_dir),
+                "--stage",
+                "separation",
+            ],
+        )
 
     def test_transcription_stage_requires_existing_separation_artifacts(self):
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -82,42 +751,31 @@ class TranscriptionStageSmokeTests(unittest.TestCase):
             self.assertEqual(raised.exception.code, 1)
 
     def test_transcription_stage_writes_artifact_after_separation(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir) / "workspace"
+        output_dir = scratch_dir("transcription-stage") / "workspace"
+        copy_workspace(self._separated_dir, output_dir)
 
-            run_main(
-                self.main_module,
-                [
-                    "--input",
-                    "dummy.wav",
-                    "--mock",
-                    "--output-dir",
-                    str(output_dir),
-                    "--stage",
-                    "separation",
-                ],
-            )
-
-            run_main(
-                self.main_module,
-                [
-                    "--input",
-                    "dummy.wav",
-                    "--mock",
-                    "--output-dir",
-                    str(output_dir),
-                    "--stage",
-                    "transcription",
-                ],
-            )
+        run_main(
+            self.main_module,
+            [
+                "--input",
+                "dummy.wav",
+                "--mock",
+                "--output-dir",
+                str(output_dir),
+                "--stage",
+                "transcription",
+            ],
+        )
 
-            transcription_path = output_dir / "data" / "transcription.json"
-            self.assertTrue(transcription_path.exists())
+        transcription_path = output_dir / "data" / "transcription.json"
+        self.assertTrue(transcription_path.exists())
 
-            with transcription_path.open("r", encoding="utf-8") as file_obj:
-                payload = json.load(file_obj)
+        with transcription_path.open("r", encoding="utf-8") as file_obj:
+            payload = json.load(file_obj)
 
-            self.assertIsInstance(payload.get("segments"), list)
+        self.assertIsInstance(payload.get("segments"), list)
+        stems = json.loads((output_dir / "data" / "stems.json").read_text(encoding="utf-8"))
+        self.assertEqual(Path(stems["DX"]).parent, output_dir)
 
 
 if __name__ == "__main__":